@@ -1,10 +1,35 @@
-from datasets import load_dataset
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 import os
 import time
 
+# Use the Rust hf_transfer client (multi-connection downloads) when installed.
+# huggingface_hub reads this once at import time, so it must be set before
+# importing datasets.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+from datasets import load_dataset
+
 # --- CONFIGURATION ---
 BASE_DIR = os.path.expanduser("~/Documents/CanLaw-RAG/data/cases")
 SCC_DIR = os.path.join(BASE_DIR, "scc")
+FC_DIR = os.path.join(BASE_DIR, "federal")
+
+DATASET = "refugee-law-lab/canadian-legal-data"
+# (config, destination) pairs, downloaded concurrently
+JOBS = [("SCC", SCC_DIR), ("FC", FC_DIR)]
+
+
+def _dir_size(path):
+    """Total size in bytes of all files under path (symlinks not followed)."""
+    total = 0
+    for entry in os.scandir(path):
+        if entry.is_file(follow_symlinks=False):
+            total += entry.stat(follow_symlinks=False).st_size
+        elif entry.is_dir(follow_symlinks=False):
+            total += _dir_size(entry.path)
+    return total
 
 
 def download_with_retry(builder_name, config, split, dest, retries=3):
@@ -20,32 +45,57 @@ def download_with_retry(builder_name, config, split, dest, retries=3):
             )
             ds.save_to_disk(dest)
             print(f"✅ Saved {len(ds)} examples to {dest}")
-            return
+            break
         except Exception as e:
             print(f"❌ Error on attempt {attempt}: {e}")
             if attempt < retries:
                 print("⏳ Waiting 10s before retrying...")
                 time.sleep(10)
-    print(f"❌ Failed to download {builder_name}-{config} after {retries} attempts.")
+    else:
+        print(f"❌ Failed to download {builder_name}-{config} after {retries} attempts.")
+        return
 
+    # Size report is informational; a failure here must not trigger a re-download
+    try:
+        print(f"📊 Size: {_dir_size(dest) / 1e9:.2f} GB")
+    except OSError as e:
+        print(f"⚠️ Could not compute size of {dest}: {e}")
 
-def download_cases():
-    """Downloads ONLY SCC cases (Federal Court already downloaded)."""
-    os.makedirs(SCC_DIR, exist_ok=True)
 
-    print("🚀 Starting download of Canadian Legal Data (SCC only)...")
+def download_cases(jobs=JOBS):
+    """Downloads the configured case datasets (SCC and Federal Court) in parallel."""
+    if not jobs:
+        print("Nothing to download.")
+        return
 
-    # SCC only
-    print(f"\n📥 Downloading SCC cases to: {SCC_DIR}")
-    download_with_retry(
-        "refugee-law-lab/canadian-legal-data",
-        "SCC",
-        "train",
-        SCC_DIR,
-    )
+    names = ", ".join(config for config, _ in jobs)
+    print(f"🚀 Starting download of Canadian Legal Data ({names})...")
+
+    # Jobs run in threads, so load_dataset must not fork its own worker pool
+    # (num_proc): forking while another thread holds a lock can deadlock.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = []
+        for config, dest in jobs:
+            os.makedirs(dest, exist_ok=True)
+            print(f"\n📥 Downloading {config} cases to: {dest}")
+            futures.append(pool.submit(download_with_retry, DATASET, config, "train", dest))
+        for future in futures:
+            future.result()
 
-    print("\n🎉 Download script finished. Federal Court data was not touched.")
+    print("\n🎉 Download script finished.")
 
 
 if __name__ == "__main__":
-    download_cases()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Download Canadian case law datasets")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[config for config, _ in JOBS],
+        help="Download only these configs (default: all)",
+    )
+    args = parser.parse_args()
+
+    selected = [job for job in JOBS if not args.only or job[0] in args.only]
+    download_cases(selected)
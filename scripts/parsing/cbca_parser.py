@@ -9,26 +9,79 @@ Output: data/processed/statutes/cbca_hierarchy.json
 
 import json
 import re
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 from lxml import etree
 
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj) -> bytes:
+        # Compact separators so output matches orjson byte-for-byte
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
-@dataclass
 class StatuteNode:
-    """Represents a node in the statute hierarchy."""
-    node_id: str                    # e.g., "cbca_part_x" or "cbca_s122_1"
-    node_type: str                  # "act", "part", "heading", "section", "subsection", "paragraph", "subparagraph"
-    parent_id: Optional[str]        # Parent node reference (None for root)
-    children: List[str] = field(default_factory=list)  # Child node IDs
-    act_name: str = ""              # "Canada Business Corporations Act"
-    label: str = ""                 # "PART X" or "122" or "(1)"
-    title: str = ""                 # Part title or marginal note
-    text: str = ""                  # Full text content (for leaf nodes)
-    full_citation: str = ""         # "CBCA s. 122(1)(a)"
-    summary: str = ""               # LLM-generated summary (populated later)
-    metadata: Dict = field(default_factory=dict)  # Additional metadata
+    """Represents a node in the statute hierarchy.
+
+    Uses __slots__ rather than a dataclass so each of the thousands of nodes
+    is stored without a per-instance __dict__. The constructor accepts the same
+    positional/keyword fields as the former dataclass, so
+    ``StatuteNode(**node.to_dict())`` round-trips, and equality is field-wise.
+    """
+
+    __slots__ = (
+        "node_id",          # e.g., "cbca_part_x" or "cbca_s122_1"
+        "node_type",        # "act", "part", "heading", "section", "subsection", "paragraph", "subparagraph"
+        "parent_id",        # Parent node reference (None for root)
+        "children",         # Child node IDs
+        "act_name",         # "Canada Business Corporations Act"
+        "label",            # "PART X" or "122" or "(1)"
+        "title",            # Part title or marginal note
+        "text",             # Full text content (for leaf nodes)
+        "full_citation",    # "CBCA s. 122(1)(a)"
+        "summary",          # LLM-generated summary (populated later)
+        "metadata",         # Additional metadata
+    )
+
+    def __init__(self, node_id: str, node_type: str, parent_id: Optional[str],
+                 children: Optional[List[str]] = None, act_name: str = "",
+                 label: str = "", title: str = "", text: str = "",
+                 full_citation: str = "", summary: str = "",
+                 metadata: Optional[Dict] = None):
+        self.node_id = node_id
+        self.node_type = node_type
+        self.parent_id = parent_id
+        self.children: List[str] = children if children is not None else []
+        self.act_name = act_name
+        self.label = label
+        self.title = title
+        self.text = text
+        self.full_citation = full_citation
+        self.summary = summary
+        self.metadata = metadata or {}
+
+    def __repr__(self) -> str:
+        return f"StatuteNode(node_id={self.node_id!r}, node_type={self.node_type!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # Mutable and compared by value, as with the former dataclass
+
+    def to_dict(self) -> Dict:
+        """Convert to JSON-serializable dictionary (containers are copied)."""
+        d = {name: getattr(self, name) for name in self.__slots__}
+        d["children"] = list(self.children)
+        d["metadata"] = dict(self.metadata)
+        return d
 
 
 @dataclass
@@ -39,18 +92,34 @@ class StatuteHierarchy:
     root_id: str                    # Root node ID
     nodes: Dict[str, StatuteNode] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Memoized get_path results; private state, not part of the data model
+        self._path_cache: Dict[str, List[str]] = {}
+
     def get_path(self, node_id: str) -> List[str]:
         """Returns hierarchy path: ['CBCA', 'PART X', 's.122', '(1)']"""
-        path = []
-        current_id = node_id
-        while current_id:
-            node = self.nodes.get(current_id)
-            if node:
-                path.append(node.label or node.title or node.node_type)
-                current_id = node.parent_id
-            else:
-                break
-        return list(reversed(path))
+        return list(self._cached_path(node_id))
+
+    def _cached_path(self, node_id: str) -> List[str]:
+        """Memoized path lookup; ancestors' paths are shared across siblings."""
+        cache = self._path_cache
+        path = cache.get(node_id)
+        if path is not None:
+            return path
+        node = self.nodes.get(node_id)
+        if not node:
+            return []
+        step = node.label or node.title or node.node_type
+        if node.parent_id is None:
+            path = [step]
+        else:
+            path = self._cached_path(node.parent_id) + [step]
+        cache[node_id] = path
+        return path
+
+    def clear_path_cache(self) -> None:
+        """Drops memoized paths; call after changing the node structure."""
+        self._path_cache.clear()
 
     def get_all_sections(self) -> List[StatuteNode]:
         """Returns all section nodes."""
@@ -63,21 +132,30 @@ class StatuteHierarchy:
             return [self.nodes[cid] for cid in node.children if cid in self.nodes]
         return []
 
+    def get_stats(self) -> Dict[str, int]:
+        """Returns node counts by type, computed in a single pass."""
+        counts = {"part": 0, "section": 0, "subsection": 0, "paragraph": 0, "subparagraph": 0}
+        for n in self.nodes.values():
+            c = counts.get(n.node_type)
+            if c is not None:
+                counts[n.node_type] = c + 1
+        return {
+            "total_nodes": len(self.nodes),
+            "parts": counts["part"],
+            "sections": counts["section"],
+            "subsections": counts["subsection"],
+            "paragraphs": counts["paragraph"],
+            "subparagraphs": counts["subparagraph"],
+        }
+
     def to_dict(self) -> Dict:
         """Convert to JSON-serializable dictionary."""
         return {
             "act_code": self.act_code,
             "act_name": self.act_name,
             "root_id": self.root_id,
-            "nodes": {k: asdict(v) for k, v in self.nodes.items()},
-            "stats": {
-                "total_nodes": len(self.nodes),
-                "parts": len([n for n in self.nodes.values() if n.node_type == "part"]),
-                "sections": len([n for n in self.nodes.values() if n.node_type == "section"]),
-                "subsections": len([n for n in self.nodes.values() if n.node_type == "subsection"]),
-                "paragraphs": len([n for n in self.nodes.values() if n.node_type == "paragraph"]),
-                "subparagraphs": len([n for n in self.nodes.values() if n.node_type == "subparagraph"]),
-            }
+            "nodes": {k: v.to_dict() for k, v in self.nodes.items()},
+            "stats": self.get_stats(),
         }
 
 
@@ -90,6 +168,15 @@ class CBCAParser:
     # Namespace handling
     NAMESPACES = {"lims": "http://justice.gc.ca/lims"}
 
+    # Precompiled patterns
+    _WS_RE = re.compile(r'\s+')
+    _PART_RE = re.compile(r'PART\s+([IVXLC]+)')
+    _SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+    # Precompiled namespace-agnostic lookups (one XPath pass instead of a namespaced/bare pair)
+    _XP_SHORT = etree.XPath(".//*[local-name()='ShortTitle']")
+    _XP_LONG = etree.XPath(".//*[local-name()='LongTitle']")
+
     def __init__(self, xml_path: str):
         self.xml_path = Path(xml_path)
         self.hierarchy = StatuteHierarchy(
@@ -102,52 +189,81 @@ class CBCAParser:
         self.current_heading_id: Optional[str] = None
 
     def parse(self) -> StatuteHierarchy:
-        """Parse the CBCA XML file and build hierarchy."""
-        print(f"Parsing {self.xml_path}...")
+        """Parse the CBCA XML file and build hierarchy.
 
-        tree = etree.parse(str(self.xml_path))
-        root = tree.getroot()
+        The file is streamed with iterparse rather than loaded as a full DOM:
+        each top-level Heading/Section is processed at its end event and then
+        cleared, so memory is released as parsing progresses.
 
-        # Create root act node
-        self._create_root_node(root)
+        Elements are matched by their bare (un-namespaced) tags, consistent with
+        the child lookups (Label, Text, ...). The Identification block must
+        precede Body, as it does in Justice Laws XML; one appearing after Body
+        is ignored.
+        """
+        print(f"Parsing {self.xml_path}...")
 
-        # Find the Body element
-        body = root.find(".//Body", namespaces=self.NAMESPACES)
-        if body is None:
-            # Try without namespace
-            body = root.find(".//Body")
+        # Single streaming pass: Identification (which precedes Body) creates the
+        # root node; Heading/Section children of the first Body are processed
+        # as they complete.
+        body = None
+        root_created = False
+        context = etree.iterparse(
+            str(self.xml_path), events=("start", "end"),
+            tag=("Identification", "Body", "Heading", "Section"),
+        )
+        for event, elem in context:
+            tag = elem.tag
+
+            if tag == "Identification":
+                if event == "end" and not root_created and body is None:
+                    self._create_root_node(elem)
+                    root_created = True
+                    elem.clear(keep_tail=True)
+                continue
+
+            if tag == "Body":
+                if event == "start" and body is None:
+                    body = elem
+                    if not root_created:
+                        self._create_root_node(None)
+                        root_created = True
+                elif event == "end" and elem is body:
+                    # Only the first Body is used; the rest of the file is skipped
+                    break
+                continue
+
+            if event != "end" or body is None or elem.getparent() is not body:
+                # Nested headings/sections (schedules, amendments) are skipped
+                # and left intact for their enclosing element
+                continue
+
+            self._process_body_element(elem)
+
+            # Free the processed subtree and any already-handled siblings
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del body[0]
+        del context
 
         if body is None:
             raise ValueError("Could not find Body element in XML")
 
-        # Process all children of Body
-        self._process_body(body)
-
         print(f"Parsed {len(self.hierarchy.nodes)} nodes")
         return self.hierarchy
 
-    def _create_root_node(self, root: etree._Element) -> None:
-        """Create the root act node."""
-        # Extract metadata from Identification element
-        ident = root.find(".//Identification", namespaces=self.NAMESPACES)
-        if ident is None:
-            ident = root.find(".//Identification")
-
+    def _create_root_node(self, ident: Optional[etree._Element]) -> None:
+        """Create the root act node from the Identification element."""
         short_title = ""
         long_title = ""
 
         if ident is not None:
-            st = ident.find(".//ShortTitle", namespaces=self.NAMESPACES)
-            if st is None:
-                st = ident.find(".//ShortTitle")
-            if st is not None:
-                short_title = self._get_text(st)
-
-            lt = ident.find(".//LongTitle", namespaces=self.NAMESPACES)
-            if lt is None:
-                lt = ident.find(".//LongTitle")
-            if lt is not None:
-                long_title = self._get_text(lt)
+            st = self._XP_SHORT(ident)
+            if st:
+                short_title = self._get_text(st[0])
+
+            lt = self._XP_LONG(ident)
+            if lt:
+                long_title = self._get_text(lt[0])
 
         root_node = StatuteNode(
             node_id=self.hierarchy.root_id,
@@ -166,15 +282,14 @@ class CBCAParser:
         )
         self.hierarchy.nodes[root_node.node_id] = root_node
 
-    def _process_body(self, body: etree._Element) -> None:
-        """Process all elements in the Body."""
-        for elem in body:
-            tag = self._get_local_tag(elem)
+    def _process_body_element(self, elem: etree._Element) -> None:
+        """Dispatch a completed child element of Body."""
+        tag = self._get_local_tag(elem)
 
-            if tag == "Heading":
-                self._process_heading(elem)
-            elif tag == "Section":
-                self._process_section(elem)
+        if tag == "Heading":
+            self._process_heading(elem)
+        elif tag == "Section":
+            self._process_section(elem)
 
     def _process_heading(self, heading: etree._Element) -> None:
         """Process a Heading element (Part or sub-heading)."""
@@ -196,7 +311,7 @@ class CBCAParser:
     def _create_part_node(self, label: str, title: str) -> None:
         """Create a Part node."""
         # Extract part number (Roman numerals)
-        part_match = re.match(r'PART\s+([IVXLC]+)', label)
+        part_match = self._PART_RE.match(label)
         part_num = part_match.group(1) if part_match else label.replace("PART ", "")
 
         node_id = f"{self.ACT_CODE}_part_{part_num.lower()}"
@@ -212,8 +327,7 @@ class CBCAParser:
             metadata={"part_number": part_num}
         )
 
-        self.hierarchy.nodes[node_id] = node
-        self.hierarchy.nodes[self.hierarchy.root_id].children.append(node_id)
+        self._attach(node, self.hierarchy.nodes[self.hierarchy.root_id])
 
         self.current_part_id = node_id
         self.current_part_label = label
@@ -225,7 +339,7 @@ class CBCAParser:
             return
 
         # Create unique ID from title
-        title_slug = re.sub(r'[^a-z0-9]+', '_', title.lower())[:30]
+        title_slug = self._SLUG_RE.sub('_', title.lower())[:30]
         node_id = f"{self.current_part_id}_heading_{title_slug}"
 
         # Ensure uniqueness
@@ -246,32 +360,45 @@ class CBCAParser:
             metadata={"level": level}
         )
 
-        self.hierarchy.nodes[node_id] = node
-        self.hierarchy.nodes[self.current_part_id].children.append(node_id)
+        self._attach(node, self.hierarchy.nodes[self.current_part_id])
 
         self.current_heading_id = node_id
 
     def _process_section(self, section: etree._Element) -> None:
         """Process a Section element."""
-        label_elem = section.find("Label")
-        marginal_elem = section.find("MarginalNote")
+        # Classify direct children in a single sweep (first Label/MarginalNote/Text wins)
+        label_elem = marginal_elem = text_elem = None
+        subsections = []
+        direct_paras = []
+        for child in section.iterchildren():
+            t = child.tag
+            if t == "Label" and label_elem is None:
+                label_elem = child
+            elif t == "MarginalNote" and marginal_elem is None:
+                marginal_elem = child
+            elif t == "Text" and text_elem is None:
+                text_elem = child
+            elif t == "Subsection":
+                subsections.append(child)
+            elif t == "Paragraph":
+                direct_paras.append(child)
 
         if label_elem is None:
             return
 
-        section_num = self._get_text(label_elem)
+        section_num = sys.intern(self._get_text(label_elem))
         marginal_note = self._get_text(marginal_elem) if marginal_elem is not None else ""
 
         # Determine parent (heading or part)
         parent_id = self.current_heading_id or self.current_part_id or self.hierarchy.root_id
+        parent = self.hierarchy.nodes.get(parent_id)
 
         node_id = f"{self.ACT_CODE}_s{section_num}"
 
         # Collect direct text (for sections without subsections)
-        direct_text = ""
-        text_elem = section.find("Text")
-        if text_elem is not None:
-            direct_text = self._get_text(text_elem)
+        direct_text = self._get_text(text_elem) if text_elem is not None else ""
+
+        has_subs = bool(subsections)
 
         node = StatuteNode(
             node_id=node_id,
@@ -283,34 +410,41 @@ class CBCAParser:
             text=direct_text,
             full_citation=f"CBCA s. {section_num}",
             metadata={
-                "has_subsections": len(section.findall("Subsection")) > 0,
+                "has_subsections": has_subs,
                 "part": self.current_part_label
             }
         )
 
-        self.hierarchy.nodes[node_id] = node
-        if parent_id in self.hierarchy.nodes:
-            self.hierarchy.nodes[parent_id].children.append(node_id)
+        self._attach(node, parent)
 
         # Process subsections
-        for subsection in section.findall("Subsection"):
-            self._process_subsection(subsection, node_id, section_num)
+        for subsection in subsections:
+            self._process_subsection(subsection, node, section_num)
 
         # Process direct paragraphs (if no subsections)
-        if not section.findall("Subsection"):
-            for para in section.findall("Paragraph"):
-                self._process_paragraph(para, node_id, section_num, "")
+        if not has_subs:
+            for para in direct_paras:
+                self._process_paragraph(para, node, section_num, "")
 
-    def _process_subsection(self, subsection: etree._Element, parent_id: str, section_num: str) -> None:
+    def _process_subsection(self, subsection: etree._Element, parent: StatuteNode, section_num: str) -> None:
         """Process a Subsection element."""
-        label_elem = subsection.find("Label")
-        marginal_elem = subsection.find("MarginalNote")
-        text_elem = subsection.find("Text")
+        label_elem = marginal_elem = text_elem = None
+        paras = []
+        for child in subsection.iterchildren():
+            t = child.tag
+            if t == "Label" and label_elem is None:
+                label_elem = child
+            elif t == "MarginalNote" and marginal_elem is None:
+                marginal_elem = child
+            elif t == "Text" and text_elem is None:
+                text_elem = child
+            elif t == "Paragraph":
+                paras.append(child)
 
         if label_elem is None:
             return
 
-        subsec_label = self._get_text(label_elem)  # e.g., "(1)" or "(1.1)"
+        subsec_label = sys.intern(self._get_text(label_elem))  # e.g., "(1)" or "(1.1)"
         marginal_note = self._get_text(marginal_elem) if marginal_elem is not None else ""
         text = self._get_text(text_elem) if text_elem is not None else ""
 
@@ -322,32 +456,39 @@ class CBCAParser:
         node = StatuteNode(
             node_id=node_id,
             node_type="subsection",
-            parent_id=parent_id,
+            parent_id=parent.node_id,
             act_name=self.ACT_NAME,
             label=subsec_label,
             title=marginal_note,
             text=text,
-            full_citation=f"CBCA s. {section_num}{subsec_label}",
+            full_citation=parent.full_citation + subsec_label,
             metadata={"section": section_num}
         )
 
-        self.hierarchy.nodes[node_id] = node
-        self.hierarchy.nodes[parent_id].children.append(node_id)
+        self._attach(node, parent)
 
         # Process paragraphs
-        for para in subsection.findall("Paragraph"):
-            self._process_paragraph(para, node_id, section_num, subsec_label)
+        for para in paras:
+            self._process_paragraph(para, node, section_num, subsec_label)
 
-    def _process_paragraph(self, paragraph: etree._Element, parent_id: str,
+    def _process_paragraph(self, paragraph: etree._Element, parent: StatuteNode,
                           section_num: str, subsec_label: str) -> None:
         """Process a Paragraph element."""
-        label_elem = paragraph.find("Label")
-        text_elem = paragraph.find("Text")
+        label_elem = text_elem = None
+        subparas = []
+        for child in paragraph.iterchildren():
+            t = child.tag
+            if t == "Label" and label_elem is None:
+                label_elem = child
+            elif t == "Text" and text_elem is None:
+                text_elem = child
+            elif t == "Subparagraph":
+                subparas.append(child)
 
         if label_elem is None:
             return
 
-        para_label = self._get_text(label_elem)  # e.g., "(a)"
+        para_label = sys.intern(self._get_text(label_elem))  # e.g., "(a)"
         text = self._get_text(text_elem) if text_elem is not None else ""
 
         clean_label = para_label.strip("()")
@@ -355,39 +496,42 @@ class CBCAParser:
         # Build node ID
         if subsec_label:
             node_id = f"{self.ACT_CODE}_s{section_num}_{subsec_label.strip('()')}_{clean_label}"
-            citation = f"CBCA s. {section_num}{subsec_label}{para_label}"
         else:
             node_id = f"{self.ACT_CODE}_s{section_num}_{clean_label}"
-            citation = f"CBCA s. {section_num}{para_label}"
 
         node = StatuteNode(
             node_id=node_id,
             node_type="paragraph",
-            parent_id=parent_id,
+            parent_id=parent.node_id,
             act_name=self.ACT_NAME,
             label=para_label,
             text=text,
-            full_citation=citation,
+            # Parent (subsection or section) citation already carries the prefix
+            full_citation=parent.full_citation + para_label,
             metadata={"section": section_num, "subsection": subsec_label}
         )
 
-        self.hierarchy.nodes[node_id] = node
-        self.hierarchy.nodes[parent_id].children.append(node_id)
+        self._attach(node, parent)
 
         # Process subparagraphs
-        for subpara in paragraph.findall("Subparagraph"):
-            self._process_subparagraph(subpara, node_id, section_num, subsec_label, para_label)
+        for subpara in subparas:
+            self._process_subparagraph(subpara, node, section_num, subsec_label, para_label)
 
-    def _process_subparagraph(self, subparagraph: etree._Element, parent_id: str,
+    def _process_subparagraph(self, subparagraph: etree._Element, parent: StatuteNode,
                               section_num: str, subsec_label: str, para_label: str) -> None:
         """Process a Subparagraph element."""
-        label_elem = subparagraph.find("Label")
-        text_elem = subparagraph.find("Text")
+        label_elem = text_elem = None
+        for child in subparagraph.iterchildren():
+            t = child.tag
+            if t == "Label" and label_elem is None:
+                label_elem = child
+            elif t == "Text" and text_elem is None:
+                text_elem = child
 
         if label_elem is None:
             return
 
-        subpara_label = self._get_text(label_elem)  # e.g., "(i)"
+        subpara_label = sys.intern(self._get_text(label_elem))  # e.g., "(i)"
         text = self._get_text(text_elem) if text_elem is not None else ""
 
         clean_label = subpara_label.strip("()")
@@ -398,19 +542,17 @@ class CBCAParser:
 
         if subsec_clean:
             node_id = f"{self.ACT_CODE}_s{section_num}_{subsec_clean}_{para_clean}_{clean_label}"
-            citation = f"CBCA s. {section_num}{subsec_label}{para_label}{subpara_label}"
         else:
             node_id = f"{self.ACT_CODE}_s{section_num}_{para_clean}_{clean_label}"
-            citation = f"CBCA s. {section_num}{para_label}{subpara_label}"
 
         node = StatuteNode(
             node_id=node_id,
             node_type="subparagraph",
-            parent_id=parent_id,
+            parent_id=parent.node_id,
             act_name=self.ACT_NAME,
             label=subpara_label,
             text=text,
-            full_citation=citation,
+            full_citation=parent.full_citation + subpara_label,
             metadata={
                 "section": section_num,
                 "subsection": subsec_label,
@@ -418,8 +560,13 @@ class CBCAParser:
             }
         )
 
-        self.hierarchy.nodes[node_id] = node
-        self.hierarchy.nodes[parent_id].children.append(node_id)
+        self._attach(node, parent)
+
+    def _attach(self, node: StatuteNode, parent: Optional[StatuteNode]) -> None:
+        """Register a node and link it under its (already resolved) parent."""
+        self.hierarchy.nodes[node.node_id] = node
+        if parent is not None:
+            parent.children.append(node.node_id)
 
     def _get_local_tag(self, elem: etree._Element) -> str:
         """Get the local tag name without namespace."""
@@ -428,25 +575,38 @@ class CBCAParser:
             return tag.split("}")[1]
         return tag
 
-    def _get_text(self, elem: etree._Element) -> str:
+    def _get_text(self, elem: Optional[etree._Element]) -> str:
         """Extract all text content from an element, stripping XML tags."""
         if elem is None:
             return ""
-        # Get all text including from child elements
-        text = etree.tostring(elem, method="text", encoding="unicode")
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        # Walk text nodes directly (including child elements) without serializing
+        return self._WS_RE.sub(' ', "".join(elem.itertext())).strip()
 
     def save_json(self, output_path: str) -> None:
-        """Save the hierarchy to a JSON file."""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.hierarchy.to_dict(), f, indent=2, ensure_ascii=False)
-
-        print(f"Saved hierarchy to {output_path}")
+        """Save the hierarchy to a JSON file.
+
+        Nodes are streamed to the file one per line instead of building the
+        full hierarchy dict first.
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        hierarchy = self.hierarchy
+
+        with open(path, 'wb') as f:
+            f.write(b'{\n')
+            f.write(b'  "act_code": ' + _dumps(hierarchy.act_code) + b',\n')
+            f.write(b'  "act_name": ' + _dumps(hierarchy.act_name) + b',\n')
+            f.write(b'  "root_id": ' + _dumps(hierarchy.root_id) + b',\n')
+            f.write(b'  "nodes": {')
+            sep = b'\n'
+            for node_id, node in hierarchy.nodes.items():
+                f.write(sep + b'    ' + _dumps(node_id) + b': ' + _dumps(node.to_dict()))
+                sep = b',\n'
+            f.write(b'\n  },\n')
+            f.write(b'  "stats": ' + _dumps(hierarchy.get_stats()) + b'\n')
+            f.write(b'}\n')
+
+        print(f"Saved hierarchy to {path}")
 
 
 def main():
@@ -478,7 +638,7 @@ def main():
     cbca_parser.save_json(str(output_path))
 
     # Print summary
-    stats = hierarchy.to_dict()["stats"]
+    stats = hierarchy.get_stats()
     print("\nParsing Summary:")
     print(f"  Total nodes: {stats['total_nodes']}")
     print(f"  Parts: {stats['parts']}")